@@ -1,6 +1,17 @@
-import requests
+import asyncio
+import itertools
+import json
+import aiohttp
+import orjson
+import requests_cache
 import pandas as pd
-from typing import Optional
+from datetime import timedelta
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Optional
+
+from gridscope.fetch_utils import HTTP_CACHE_PATH, run_sync
 
 
 # This script is far from ready since there are a lot of ressources already available to download directly as a csv for training
@@ -9,9 +20,32 @@ from typing import Optional
 
 
 class NesoDemandFetcher:
-    def __init__(self, resource_id: str):
+    def __init__(
+        self,
+        resource_id: str,
+        low_memory: bool = True,
+        cache_path: Path = HTTP_CACHE_PATH,
+    ):
         self.BASE_URL = "https://api.neso.energy/api/3/action/"
         self.resource_id = resource_id
+        self.low_memory = low_memory
+        self.cache_path = Path(cache_path)
+
+        # Metadata changes rarely; keep it on disk but revalidate often
+        self.session = requests_cache.CachedSession(
+            self.cache_path,
+            expire_after=timedelta(hours=6),
+            allowable_methods=("GET",),
+            urls_expire_after={"*/resource_show": timedelta(minutes=30)},
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(total=3, backoff_factor=0.5),
+            ),
+        )
 
     def get_resource_metadata(self) -> dict:
         """
@@ -19,42 +53,117 @@ class NesoDemandFetcher:
         """
         url = self.BASE_URL + "resource_show"
         params = {"id": self.resource_id}
-        r = requests.get(url, params=params)
+        r = self.session.get(url, params=params, timeout=(5, 30))
         r.raise_for_status()
-        return r.json()["result"]
+        return orjson.loads(r.content)["result"]
+
+    async def _get_result(
+        self, session: aiohttp.ClientSession, params: dict, retries: int = 5
+    ) -> dict:
+        """
+        Runs one datastore_search call, retrying transient failures with exponential
+        backoff. Client errors other than 429 are raised straight away.
+        """
+        url = self.BASE_URL + "datastore_search"
+        for attempt in range(retries):
+            try:
+                async with session.get(url, params=params) as r:
+                    r.raise_for_status()
+                    return orjson.loads(await r.read())["result"]
+            except aiohttp.ClientResponseError as e:
+                if 400 <= e.status < 500 and e.status != 429:
+                    raise
+                if attempt == retries - 1:
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == retries - 1:
+                    raise
+            await asyncio.sleep(2**attempt)
+
+    async def _fetch_page(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        params: dict,
+        offset: int,
+        limit: int,
+        retries: int = 5,
+    ) -> List[dict]:
+        """
+        Fetches a single datastore_search window.
+        """
+        # Offset windows are only stable across requests with an explicit order
+        page_params = {**params, "offset": offset, "limit": limit, "sort": "_id"}
+
+        async with semaphore:
+            result = await self._get_result(session, page_params, retries)
+        return result["records"]
+
+    async def _fetch_all_pages(
+        self, params: dict, limit: int, page_size: int, max_concurrency: int
+    ) -> List[dict]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=120)
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            # A zero-length probe tells us how many records match
+            probe = await self._get_result(session, {**params, "limit": 0})
+            total = min(probe["total"], limit)
+
+            tasks = [
+                self._fetch_page(
+                    session, semaphore, params, off, min(page_size, total - off)
+                )
+                for off in range(0, total, page_size)
+            ]
+            pages = await asyncio.gather(*tasks)
+
+        return list(itertools.chain.from_iterable(pages))
 
     def fetch_demand_data(
-        self, limit: int = 10000, filters: Optional[dict] = None
+        self,
+        limit: int = 10000,
+        filters: Optional[dict] = None,
+        page_size: int = 1000,
+        max_concurrency: int = 16,
     ) -> pd.DataFrame:
         """
         Fetches demand data from NESO for the given resource_id.
         You can use filters to narrow it (e.g., date). This option may be removed in the future. But chatgpt is pretty nice to integrate it here.
         It may not be the right place for it.
+        Records are pulled concurrently in pages of page_size, up to limit records in total.
         """
-        url = self.BASE_URL + "datastore_search"
-        params = {"resource_id": self.resource_id, "limit": limit}
+        params = {"resource_id": self.resource_id}
         if filters:
-            params["filters"] = filters
+            params["filters"] = json.dumps(filters)
 
-        r = requests.get(url, params=params)
-        r.raise_for_status()
-        records = r.json()["result"]["records"]
+        records = run_sync(
+            self._fetch_all_pages(params, limit, page_size, max_concurrency)
+        )
         df = pd.DataFrame(records)
 
         # Try to find a timestamp column
         if "datetime" in df.columns:
-            df["datetime"] = pd.to_datetime(df["datetime"])
+            df["datetime"] = pd.to_datetime(
+                df["datetime"], format="ISO8601", cache=True
+            )
         else:
             # Example fallback:
+            # SP1 = 00:00–00:30, SP2 = 00:30–01:00 ... SP48 = 23:30–00:00
             if "SETTLEMENT_DATE" in df.columns and "SETTLEMENT_PERIOD" in df.columns:
+                # Each date repeats per period; pandas' own cache check decides
+                # whether the unique-value cache pays off
                 df["datetime"] = pd.to_datetime(
-                    df["SETTLEMENT_DATE"]
-                    + " "
-                    + df["SETTLEMENT_PERIOD"].astype(str)
-                    + ":00",
-                    format="%Y-%m-%d %H:%M:%S",
+                    df["SETTLEMENT_DATE"], format="ISO8601", cache=True
+                ) + pd.to_timedelta(
+                    (df["SETTLEMENT_PERIOD"].astype("int16") - 1) * 30, unit="m"
                 )
         df = df.sort_values("datetime").reset_index(drop=True)
+
+        if self.low_memory:
+            df = df.astype({c: "float32" for c in df.select_dtypes("float64").columns})
+            if "SETTLEMENT_PERIOD" in df.columns:
+                df["SETTLEMENT_PERIOD"] = df["SETTLEMENT_PERIOD"].astype("int16")
         return df
 
 
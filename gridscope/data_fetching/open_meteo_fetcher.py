@@ -1,8 +1,14 @@
-import requests
+import orjson
+import requests_cache
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import List
+from datetime import datetime, timedelta
+from typing import List, Literal
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from gridscope.fetch_utils import HTTP_CACHE_PATH
 
 
 class OpenMeteoFetcher:
@@ -14,6 +20,8 @@ class OpenMeteoFetcher:
         end_date: str = "2024-10-10",
         hourly: List[str] = ["temperature_2m", "wind_speed_10m", "direct_radiation"],
         timezone: str = "Europe/London",
+        low_memory: bool = True,
+        cache_path: Path = HTTP_CACHE_PATH,
     ):
         self.fetched_weather_data: pd.DataFrame = None
         self.start_date = start_date
@@ -22,16 +30,46 @@ class OpenMeteoFetcher:
         self.longitude = longitude
         self.hourly = hourly
         self.timezone = timezone
+        self.low_memory = low_memory
+        self.cache_path = Path(cache_path)
+
+        # Archive data for a past range never changes, so serve repeats from disk
+        self.session = requests_cache.CachedSession(
+            self.cache_path,
+            expire_after=timedelta(hours=6),
+            allowable_methods=("GET",),
+            stale_if_error=True,
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(total=3, backoff_factor=0.5),
+            ),
+        )
 
     def fetch_weather_data(
-        self, save_to_csv=False, dir_to_csv=Path("data/weather")
+        self,
+        save=False,
+        out_dir=Path("data/weather"),
+        fmt: Literal["csv", "parquet"] = "parquet",
     ) -> pd.DataFrame:
         """
         Fetch hourly weather data (temperature, wind speed, solar radiation)
         for a given latitude/longitude and date range.
+        With save, a previously saved file for the same range is loaded
+        instead of calling the API.
         """
-        csv_filename = f"lat-{self.lattitude}_long-{self.longitude}_start-{self.start_date}_end-{self.end_date}.csv"
-        csv_file = dir_to_csv / csv_filename
+        out_filename = f"lat-{self.lattitude}_long-{self.longitude}_start-{self.start_date}_end-{self.end_date}.{fmt}"
+        out_file = out_dir / out_filename
+        if save and out_file.exists():
+            if fmt == "parquet":
+                df = pd.read_parquet(out_file)
+            else:
+                df = pd.read_csv(out_file, parse_dates=["datetime"])
+            self.fetched_weather_data = df
+            return df
 
         base_url = "https://archive-api.open-meteo.com/v1/archive"
         params = {
@@ -43,28 +81,32 @@ class OpenMeteoFetcher:
             "timezone": self.timezone,
         }
 
-        response = requests.get(base_url, params=params)
+        response = self.session.get(base_url, params=params, timeout=(5, 30))
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
-        # TODO: edit this below
+        # Times come back as "YYYY-MM-DDTHH:MM", which numpy parses natively
+        dtype = "float32" if self.low_memory else "float64"
         df = pd.DataFrame(
             {
-                "datetime": data["hourly"]["time"],
-                "temperature_2m": data["hourly"]["temperature_2m"],
-                "wind_speed_10m": data["hourly"]["wind_speed_10m"],
-                "direct_radiation": data["hourly"]["direct_radiation"],
+                "datetime": np.array(data["hourly"]["time"], dtype="datetime64[m]"),
+                **{v: np.asarray(data["hourly"][v], dtype=dtype) for v in self.hourly},
             }
         )
-        df["datetime"] = pd.to_datetime(df["datetime"])
-        df.to_csv(csv_file)
+        if save:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            if fmt == "parquet":
+                df.to_parquet(out_file, index=False, compression="zstd")
+            else:
+                df.to_csv(out_file, index=False)
 
+        self.fetched_weather_data = df
         return df
 
 
 def main():
     fetcher = OpenMeteoFetcher()
-    df_weather = fetcher.fetch_weather_data(save_to_csv=True)
+    df_weather = fetcher.fetch_weather_data(save=True)
     print(df_weather)
 
 
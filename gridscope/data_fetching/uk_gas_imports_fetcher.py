@@ -1,10 +1,25 @@
+import re
+import functools
 import pandas as pd
+from datetime import date
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Literal
 from entsog import EntsogPandasClient
 
 import time
 
 
+@functools.lru_cache(maxsize=1)
+def _query_operator_point_directions(week: tuple) -> pd.DataFrame:
+    """
+    ENTSOG point directions are slow to download and change rarely, so the result
+    is shared by every fetcher in the process. week only keys the cache.
+    """
+    print("Querying ENTSOG operator point directions...")
+    return EntsogPandasClient().query_operator_point_directions()
+
+
 class UKGasImportsFetcher:
     """
     Fetch detailed UK gas import flows from ENTSOG Transparency Platform.
@@ -26,22 +41,37 @@ class UKGasImportsFetcher:
         "bbl",
     ]
 
-    def __init__(self, start_date: str, end_date: str, save_dir: str = "data/gas"):
+    # One case-insensitive alternation, compiled once for all instances
+    _KEYWORD_RE = re.compile(
+        "|".join(map(re.escape, UK_IMPORT_KEYWORDS)), re.IGNORECASE
+    )
+
+    def __init__(
+        self,
+        start_date: str,
+        end_date: str,
+        save_dir: str = "data/gas",
+        max_workers: int = 6,
+        low_memory: bool = True,
+    ):
         self.start_date = start_date
         self.end_date = end_date
+        self.max_workers = max_workers
+        self.low_memory = low_memory
         self.save_dir = Path(save_dir)
         self.save_dir.mkdir(parents=True, exist_ok=True)
         self.client = EntsogPandasClient()
 
     def _build_uk_point_direction_keys(self):
-        print("Querying ENTSOG operator point directions...")
-
-        points = self.client.query_operator_point_directions()
-        labels = points["point_label"].str.lower()
+        points = _query_operator_point_directions(date.today().isocalendar()[:2])
 
         gb_points = points[
             (points["direction_key"] == "entry")
-            & (labels.str.contains("|".join(self.UK_IMPORT_KEYWORDS)))
+            & (
+                points["point_label"].str.contains(
+                    self._KEYWORD_RE, regex=True, na=False
+                )
+            )
         ]
 
         if gb_points.empty:
@@ -52,12 +82,77 @@ class UKGasImportsFetcher:
             print(f"  • {label}")
 
         # Build point keys for query
-        keys = [
-            f"{row['operator_key']}{row['point_key']}{row['direction_key']}"
-            for _, row in gb_points.iterrows()
-        ]
+        keys = (
+            gb_points["operator_key"].astype(str)
+            + gb_points["point_key"].astype(str)
+            + gb_points["direction_key"].astype(str)
+        ).tolist()
         return gb_points, keys
 
+    def _fetch_chunk(
+        self, start: pd.Timestamp, end: pd.Timestamp, keys: list
+    ) -> pd.Series | None:
+        """
+        Queries one time chunk and reduces it to hourly MWh totals.
+        Returns None on failure or when no data came back.
+        """
+        print(f" - Querying {start.date()} → {end.date()} ...")
+
+        try:
+            df_chunk = self.client.query_operational_point_data(
+                start=start,
+                end=end,
+                indicators=["physical_flow"],
+                point_directions=keys,
+                verbose=False,
+            )
+        except Exception as e:
+            print(f"    !! Failed for {start.date()} → {end.date()} : {e}")
+            return None
+
+        if df_chunk.empty:
+            print(f"    (no data returned for {start.date()} → {end.date()})")
+            return None
+
+        return self._hourly_totals(df_chunk)
+
+    def _hourly_totals(self, df: pd.DataFrame) -> pd.Series:
+        # --------------------------------------------------------------
+        # Step 1 — Convert timestamp field
+        # --------------------------------------------------------------
+        ts_candidates = ["period_from", "periodFrom", "gasDayStart", "timestamp"]
+        ts_col = next((c for c in ts_candidates if c in df.columns), None)
+
+        if ts_col is None:
+            raise RuntimeError(
+                f"No usable timestamp column found. Available columns: {list(df.columns)}"
+            )
+
+        df[ts_col] = pd.to_datetime(
+            df[ts_col], errors="coerce", utc=True, format="ISO8601"
+        )
+        df = df.dropna(subset=[ts_col])
+        df["timestamp"] = df[ts_col].dt.tz_convert(None)
+
+        # --------------------------------------------------------------
+        # Step 2 — convert flow to MWh/h
+        # --------------------------------------------------------------
+        df["value"] = pd.to_numeric(df["value"], errors="coerce")
+        df = df.dropna(subset=["value"])
+
+        unit = str(df["unit"].iloc[0]).lower() if len(df) else ""
+
+        # Scale in place and rename rather than allocating a second column
+        if "kwh" in unit:
+            df["value"] /= 1000.0
+        df = df.rename(columns={"value": "MWh_hour"})
+
+        # --------------------------------------------------------------
+        # Step 3 — Sum all UK entry points per hour
+        # --------------------------------------------------------------
+        # Collapse any sub-hourly rows into their hour in the same pass
+        return df.groupby(df["timestamp"].dt.floor("h"), sort=False)["MWh_hour"].sum()
+
     # ATTEMPTING TO MERGE SITE MAPPINGS TO GET NICE LABELS INSTEAD OF DEALING WITH CRYPTING EIC-LIKE IDs
 
     # def fetch(self) -> pd.DataFrame:
@@ -183,14 +278,17 @@ class UKGasImportsFetcher:
     #     # --------------------------------------------------------------
     #     # Step 5 — Pivot to hourly import matrix
     #     # --------------------------------------------------------------
-    #     pivot = df.pivot_table(
-    #         index="timestamp",
-    #         columns="point_label",
-    #         values="MWh_hour",
-    #         aggfunc="sum",
-    #     ).sort_index()
+    #     pivot = (
+    #         df.groupby(["timestamp", "point_label"], sort=False)["MWh_hour"]
+    #         .sum()
+    #         .unstack(fill_value=0)
+    #         .sort_index()
+    #     )
 
-    #     pivot = pivot.asfreq("H").fillna(0)
+    #     pivot = pivot.reindex(
+    #         pd.date_range(pivot.index.min(), pivot.index.max(), freq="h"),
+    #         fill_value=0,
+    #     )
 
     #     print(f"Final import matrix shape: {pivot.shape}")
 
@@ -207,78 +305,38 @@ class UKGasImportsFetcher:
         if dates[-1] < pd.Timestamp(self.end_date):
             dates = dates.append(pd.DatetimeIndex([self.end_date]))
 
-        frames = []
-
-        for i in range(len(dates) - 1):
-            start = dates[i].tz_localize("Europe/Brussels")
-            end = dates[i + 1].tz_localize("Europe/Brussels")
-
-            print(f" - Querying {start.date()} → {end.date()} ...")
-
-            try:
-                df_chunk = self.client.query_operational_point_data(
-                    start=start,
-                    end=end,
-                    indicators=["physical_flow"],
-                    point_directions=keys,
-                    verbose=False,
-                )
-            except Exception as e:
-                print(f"    !! Failed for {start.date()} → {end.date()} : {e}")
-                continue
-
-            if df_chunk.empty:
-                print("    (no data returned)")
-                continue
-
-            frames.append(df_chunk)
-
-        if not frames:
-            raise RuntimeError("No ENTSOG gas flow data returned for any period.")
-
-        df = pd.concat(frames, ignore_index=True)
-
-        print(f"Retrieved {len(df)} ENTSOG flow rows.")
-        print(f"DF Columns: {list(df.columns)}")
-
-        # --------------------------------------------------------------
-        # Step 1 — Convert timestamp field
-        # --------------------------------------------------------------
-        ts_candidates = ["period_from", "periodFrom", "gasDayStart", "timestamp"]
-        ts_col = next((c for c in ts_candidates if c in df.columns), None)
-
-        if ts_col is None:
-            raise RuntimeError(
-                f"No usable timestamp column found. Available columns: {list(df.columns)}"
+        pairs = [
+            (
+                dates[i].tz_localize("Europe/Brussels"),
+                dates[i + 1].tz_localize("Europe/Brussels"),
             )
+            for i in range(len(dates) - 1)
+        ]
 
-        df[ts_col] = pd.to_datetime(df[ts_col], errors="coerce", utc=True)
-        df = df.dropna(subset=[ts_col])
-        df["timestamp"] = df[ts_col].dt.tz_convert(None)
-
-        # --------------------------------------------------------------
-        # Step 2 — convert flow to MWh/h and aggregate total for UK
-        # --------------------------------------------------------------
-        df["value"] = pd.to_numeric(df["value"], errors="coerce")
-        df = df.dropna(subset=["value"])
-
-        unit = str(df["unit"].iloc[0]).lower()
+        # Monthly chunks are independent, so overlap their network waits
+        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+            futures = [ex.submit(self._fetch_chunk, s, e, keys) for s, e in pairs]
+            partials = [
+                hourly
+                for f in as_completed(futures)
+                if (hourly := f.result()) is not None
+            ]
 
-        if "kwh" in unit:
-            df["MWh_hour"] = df["value"] / 1000.0
-        else:
-            df["MWh_hour"] = df["value"]
+        if not partials:
+            raise RuntimeError("No ENTSOG gas flow data returned for any period.")
 
-        # --------------------------------------------------------------
-        # Step 3 — Aggregate to TOTAL UK imports per hour
-        # --------------------------------------------------------------
+        # Each chunk is already reduced, so only the hourly partials are combined
         df_hourly = (
-            df.groupby(df["timestamp"])["MWh_hour"]
+            pd.concat(partials)
+            .groupby(level=0, sort=True)
             .sum()
             .rename("UK_imports_MWh_hour")
             .to_frame()
-            .sort_index()
         )
+        df_hourly.index.name = "timestamp"
+
+        if self.low_memory:
+            df_hourly = df_hourly.astype("float32")
 
         # --------------------------------------------------------------
         # Optionally resample to 30-min here if desired
@@ -288,9 +346,12 @@ class UKGasImportsFetcher:
         print(f"Final hourly records: {len(df_hourly)}")
         return df_hourly
 
-    def save(self, df: pd.DataFrame):
-        file = self.save_dir / f"uk_gas_imports_{self.start_date}_{self.end_date}.csv"
-        df.to_csv(file)
+    def save(self, df: pd.DataFrame, fmt: Literal["csv", "parquet"] = "parquet"):
+        file = self.save_dir / f"uk_gas_imports_{self.start_date}_{self.end_date}.{fmt}"
+        if fmt == "parquet":
+            df.to_parquet(file, compression="zstd")
+        else:
+            df.to_csv(file)
         print(f"Saved UK gas imports → {file}")
 
     def run(self):
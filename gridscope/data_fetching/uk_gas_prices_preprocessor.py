@@ -1,6 +1,8 @@
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from typing import Literal
+from scipy.interpolate import CubicSpline
 
 
 class GasPricePreprocessor:
@@ -9,17 +11,28 @@ class GasPricePreprocessor:
     produces a cleaned daily dataset, and optionally interpolates to 30-minute resolution.
     """
 
+    __slots__ = (
+        "csv_path",
+        "date_col",
+        "value_col",
+        "convert_to_gbp_mwh",
+        "low_memory",
+        "df",
+    )
+
     def __init__(
         self,
         csv_path: str | Path,
         date_col: str = "Date",
         value_col: str = "SAP actual day",
         convert_to_gbp_mwh: bool = True,
+        low_memory: bool = True,
     ):
         self.csv_path = Path(csv_path)
         self.date_col = date_col
         self.value_col = value_col
         self.convert_to_gbp_mwh = convert_to_gbp_mwh
+        self.low_memory = low_memory  # store prices as float32
 
         self.df = None  # daily dataset
 
@@ -31,10 +44,14 @@ class GasPricePreprocessor:
         if not self.csv_path.exists():
             raise FileNotFoundError(f"SAP CSV not found: {self.csv_path}")
 
-        df = pd.read_csv(self.csv_path)
+        df = pd.read_csv(
+            self.csv_path,
+            engine="pyarrow",
+            usecols=[self.date_col, self.value_col],
+        )
 
-        # Convert DD.MM.YY → datetime
-        df[self.date_col] = pd.to_datetime(df[self.date_col], dayfirst=True)
+        # Convert DD/MM/YYYY → datetime
+        df[self.date_col] = pd.to_datetime(df[self.date_col], format="%d/%m/%Y")
 
         # Keep only the date + value
         df = df[[self.date_col, self.value_col]].rename(
@@ -52,6 +69,9 @@ class GasPricePreprocessor:
         else:
             df["SAP_GBP_per_MWh"] = df["SAP_p_per_kWh"]
 
+        if self.low_memory:
+            df = df.astype({c: "float32" for c in df.select_dtypes("float64").columns})
+
         self.df = df
         return df
 
@@ -63,14 +83,38 @@ class GasPricePreprocessor:
         if self.df is None:
             raise ValueError("Load data first using .load()")
 
-        df_resampled = self.df.resample("30min").interpolate(method)
-        return df_resampled
+        if method != "cubic":
+            return self.df.resample("30min").interpolate(method)
+
+        # Fit one spline per column on the raw daily points and evaluate it
+        # on the 30-minute grid in a single call
+        new_idx = pd.date_range(self.df.index.min(), self.df.index.max(), freq="30min")
+        x_new = new_idx.asi8
+        out = {}
+        for col in self.df.columns:
+            s = self.df[col].dropna()
+            # No extrapolation: days before the first or after the last price stay NaN
+            cs = CubicSpline(s.index.asi8, s.to_numpy(), extrapolate=False)
+            out[col] = cs(x_new).astype(s.dtype)
+
+        return pd.DataFrame(out, index=new_idx.rename(self.df.index.name))
 
     # ------------------------------------------------------------------
-    def save(self, df: pd.DataFrame, output_path: str | Path) -> None:
-        output_path = Path(output_path)
+    def save(
+        self,
+        df: pd.DataFrame,
+        output_path: str | Path,
+        fmt: Literal["csv", "parquet"] = "parquet",
+    ) -> None:
+        """
+        Saves a dataset. The suffix of output_path is replaced to match fmt.
+        """
+        output_path = Path(output_path).with_suffix(f".{fmt}")
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(output_path)
+        if fmt == "parquet":
+            df.to_parquet(output_path, compression="zstd")
+        else:
+            df.to_csv(output_path)
         print(f"Saved gas price data → {output_path}")
 
 
@@ -87,8 +131,8 @@ def main():
     df_30min = processor.interpolate_half_hourly(method="cubic")
 
     # Save both
-    processor.save(df_daily, "data/gas/processed/sap_gas_daily.csv")
-    processor.save(df_30min, "data/gas/processed/sap_gas_30min.csv")
+    processor.save(df_daily, "data/gas/processed/sap_gas_daily.parquet")
+    processor.save(df_30min, "data/gas/processed/sap_gas_30min.parquet")
 
     print(df_daily.head())
     print(df_30min.head())
@@ -1,13 +1,66 @@
 # src/data/weather_multi.py
+import asyncio
+import aiohttp
+import orjson
 import requests
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from scipy.interpolate import interp1d
 from pathlib import Path
 from typing import List
-import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from gridscope.fetch_utils import run_sync
 
 # OPEN_METEO_ARCHIVE = "https://archive-api.open-meteo.com/v1/archive"
 
+HALF_HOUR_NS = 30 * 60 * 1_000_000_000
+# Rate limits and gateway errors worth retrying rather than failing on
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+def _time_index(times: List[str]) -> pd.DatetimeIndex:
+    """
+    DatetimeIndex named "datetime" for an Open-Meteo hourly time list.
+    """
+    # Open-Meteo always sends "%Y-%m-%dT%H:%M", so skip format inference
+    parsed = pd.to_datetime(times, format="%Y-%m-%dT%H:%M", cache=True)
+    return pd.DatetimeIndex(parsed, name="datetime")
+
+
+def _interpolate_to_30min(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Same result as df.resample("30min").interpolate("time"), but gap-free columns
+    are interpolated together in one call instead of column by column.
+    """
+    xp = df.index.as_unit("ns").asi8
+    n = (xp[-1] - xp[0]) // HALF_HOUR_NS + 1
+    x = xp[0] + HALF_HOUR_NS * np.arange(n, dtype="i8")
+    values = df.to_numpy()
+    out = np.empty((len(x), values.shape[1]), dtype=values.dtype)
+
+    has_nan = np.isnan(values).any(axis=0)
+    if not has_nan.all():
+        out[:, ~has_nan] = interp1d(
+            xp, values[:, ~has_nan], axis=0, assume_sorted=True
+        )(x)
+
+    # Columns with gaps: interpolate over valid points, keep leading gaps as NaN
+    for j in np.flatnonzero(has_nan):
+        valid = ~np.isnan(values[:, j])
+        if not valid.any():
+            out[:, j] = np.nan
+            continue
+        out[:, j] = np.interp(x, xp[valid], values[valid, j])
+        out[x < xp[valid][0], j] = np.nan
+
+    idx = pd.DatetimeIndex(x.view("datetime64[ns]"), name=df.index.name)
+    return pd.DataFrame(out, index=idx, columns=df.columns)
+
 
 class OpenMeteoFetcherUk:
     """
@@ -17,9 +70,35 @@ class OpenMeteoFetcherUk:
 
     OPEN_METEO_ARCHIVE = "https://archive-api.open-meteo.com/v1/archive"
 
-    def __init__(self, start_date: str = "2024-10-01", end_date: str = "2024-10-15"):
+    def __init__(
+        self,
+        start_date: str = "2024-10-01",
+        end_date: str = "2024-10-15",
+        max_workers: int = 16,
+        cache_dir: Path = Path("data/weather"),
+    ):
         self.start_date = start_date
         self.end_date = end_date
+        self.max_workers = max_workers
+        self.cache_dir = Path(cache_dir)
+
+        # One keep-alive pool shared by all site requests; rate limits and
+        # gateway errors are retried with exponential backoff / Retry-After
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=2,
+                    status_forcelist=RETRY_STATUSES,
+                    respect_retry_after_header=True,
+                ),
+            ),
+        )
+        self.session.headers.update({"Accept-Encoding": "gzip"})
 
         # ---- Demand-related temperature sites (major UK cities) ----
         self.DEMAND_TEMP_SITES = [
@@ -58,19 +137,21 @@ class OpenMeteoFetcherUk:
             (51.6, -3.0),  # South Wales
         ]
 
+        # Site specs and output column names are fixed per fetcher; build them once
+        self.site_requests = self._site_requests()
+        self.column_names = [
+            rename[v] for _, _, hourly, rename in self.site_requests for v in hourly
+        ]
+
         self.weather_df: pd.DataFrame = None
 
     # ----------------------------------------------------------------
     # Internal utility: fetch one site
     # ----------------------------------------------------------------
-    def fetch_openmeteo_hourly(
-        self,
-        lat: float,
-        lon: float,
-        hourly: List[str],
-        timezone: str = "Europe/London",
-    ) -> pd.DataFrame:
-        params = {
+    def _site_params(
+        self, lat: float, lon: float, hourly: List[str], timezone: str
+    ) -> dict:
+        return {
             "latitude": lat,
             "longitude": lon,
             "start_date": self.start_date,
@@ -78,18 +159,83 @@ class OpenMeteoFetcherUk:
             "hourly": ",".join(hourly),
             "timezone": timezone,
         }
-        r = requests.get(self.OPEN_METEO_ARCHIVE, params=params, timeout=60)
+
+    def _fetch_site_json(
+        self,
+        lat: float,
+        lon: float,
+        hourly: List[str],
+        timezone: str = "Europe/London",
+    ) -> dict:
+        params = self._site_params(lat, lon, hourly, timezone)
+        r = self.session.get(self.OPEN_METEO_ARCHIVE, params=params, timeout=60)
         r.raise_for_status()
-        data = r.json()
+        return orjson.loads(r.content)
+
+    async def _fetch_site_json_async(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        lat: float,
+        lon: float,
+        hourly: List[str],
+        timezone: str = "Europe/London",
+        backoff_factor: float = 2,
+        retries: int = 5,
+    ) -> dict:
+        """
+        On HTTP 429 / 502 / 503 / 504 waits for the Retry-After header (or
+        backoff_factor * 2**attempt seconds) before trying again. Connection
+        errors and timeouts are retried the same way.
+        """
+        params = self._site_params(lat, lon, hourly, timezone)
+        for attempt in range(retries):
+            wait = backoff_factor * 2**attempt
+            try:
+                async with semaphore:
+                    async with session.get(self.OPEN_METEO_ARCHIVE, params=params) as r:
+                        if r.status not in RETRY_STATUSES:
+                            r.raise_for_status()
+                            return orjson.loads(await r.read())
+                        reason = f"HTTP {r.status}"
+                        retry_after = r.headers.get("Retry-After", "")
+                        if retry_after.isdigit():
+                            wait = float(retry_after)
+            except aiohttp.ClientResponseError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == retries - 1:
+                    raise
+                reason = type(e).__name__
 
-        df = pd.DataFrame({"datetime": data["hourly"]["time"]})
-        for v in hourly:
-            df[v] = data["hourly"][v]
-        df["datetime"] = pd.to_datetime(df["datetime"])
-        return df.set_index("datetime").sort_index()
+            if attempt == retries - 1:
+                break
+            print(f"Open-Meteo request failed ({reason}), retrying in {wait:.0f}s ...")
+            await asyncio.sleep(wait)
 
-    def build_weather_dataset(self, interpolate_to_30min: bool = True) -> pd.DataFrame:
-        all_dfs = []
+        raise RuntimeError(f"Open-Meteo kept failing for site ({lat}, {lon})")
+
+    def fetch_openmeteo_hourly(
+        self,
+        lat: float,
+        lon: float,
+        hourly: List[str],
+        timezone: str = "Europe/London",
+    ) -> pd.DataFrame:
+        data = self._fetch_site_json(lat, lon, hourly, timezone)
+        return self._hourly_frame(data, hourly)
+
+    @staticmethod
+    def _hourly_frame(data: dict, hourly: List[str]) -> pd.DataFrame:
+        # Open-Meteo returns hours in order, so no set_index / sort is needed
+        idx = _time_index(data["hourly"]["time"])
+        return pd.DataFrame({v: data["hourly"][v] for v in hourly}, index=idx)
+
+    def _site_requests(self) -> list:
+        """
+        Lists every site to query as (lat, lon, hourly variables, column rename map).
+        """
+        site_requests = []
 
         # ===============================================================
         # Demand temperature sites (major cities)
@@ -99,29 +245,28 @@ class OpenMeteoFetcherUk:
         # - precipitation (mm)
         # ===============================================================
         for i, (lat, lon) in enumerate(self.DEMAND_TEMP_SITES, start=1):
-            df_temp = self.fetch_openmeteo_hourly(
-                lat,
-                lon,
-                [
-                    "temperature_2m",  # ESSENTIAL: demand driver
-                    "relative_humidity_2m",  # ESSENTIAL: complements temperature
-                    "precipitation",  # ESSENTIAL: cold/rainy regime proxy
-                    "dew_point_2m",
-                    "pressure_msl",
-                    "cloud_cover",
-                ],
+            site_requests.append(
+                (
+                    lat,
+                    lon,
+                    [
+                        "temperature_2m",  # ESSENTIAL: demand driver
+                        "relative_humidity_2m",  # ESSENTIAL: complements temperature
+                        "precipitation",  # ESSENTIAL: cold/rainy regime proxy
+                        "dew_point_2m",
+                        "pressure_msl",
+                        "cloud_cover",
+                    ],
+                    {
+                        "temperature_2m": f"temp_site{i}",
+                        "relative_humidity_2m": f"humidity_site{i}",
+                        "precipitation": f"precip_site{i}",
+                        "dew_point_2m": f"dewpoint_site{i}",
+                        "pressure_msl": f"pressure_site{i}",
+                        "cloud_cover": f"cloud_site{i}",
+                    },
+                )
             )
-            df_temp = df_temp.rename(
-                columns={
-                    "temperature_2m": f"temp_site{i}",
-                    "relative_humidity_2m": f"humidity_site{i}",
-                    "precipitation": f"precip_site{i}",
-                    "dew_point_2m": f"dewpoint_site{i}",
-                    "pressure_msl": f"pressure_site{i}",
-                    "cloud_cover": f"cloud_site{i}",
-                }
-            )
-            all_dfs.append(df_temp)
 
         # ===============================================================
         # Wind sites (offshore + onshore)
@@ -131,29 +276,28 @@ class OpenMeteoFetcherUk:
         # - pressure_msl (hPa)
         # ===============================================================
         for i, (lat, lon) in enumerate(self.WIND_SITES, start=1):
-            df_wind = self.fetch_openmeteo_hourly(
-                lat,
-                lon,
-                [
-                    "wind_speed_100m",  # ESSENTIAL: generation proxy
-                    "wind_direction_100m",  # ESSENTIAL: regional correlation
-                    "pressure_msl",  # ESSENTIAL: regime classifier
-                    "temperature_2m",
-                    "relative_humidity_2m",
-                    "precipitation",
-                ],
-            )
-            df_wind = df_wind.rename(
-                columns={
-                    "wind_speed_100m": f"wind_speed_site{i}",
-                    "wind_direction_100m": f"wind_dir_site{i}",
-                    "pressure_msl": f"pressure_site{i}",
-                    "temperature_2m": f"temp_site_wind{i}",
-                    "relative_humidity_2m": f"humidity_site_wind{i}",
-                    "precipitation": f"precip_site_wind{i}",
-                }
+            site_requests.append(
+                (
+                    lat,
+                    lon,
+                    [
+                        "wind_speed_100m",  # ESSENTIAL: generation proxy
+                        "wind_direction_100m",  # ESSENTIAL: regional correlation
+                        "pressure_msl",  # ESSENTIAL: regime classifier
+                        "temperature_2m",
+                        "relative_humidity_2m",
+                        "precipitation",
+                    ],
+                    {
+                        "wind_speed_100m": f"wind_speed_site{i}",
+                        "wind_direction_100m": f"wind_dir_site{i}",
+                        "pressure_msl": f"pressure_site_wind{i}",
+                        "temperature_2m": f"temp_site_wind{i}",
+                        "relative_humidity_2m": f"humidity_site_wind{i}",
+                        "precipitation": f"precip_site_wind{i}",
+                    },
+                )
             )
-            all_dfs.append(df_wind)
 
         # ===============================================================
         # Solar sites (southern UK)
@@ -162,82 +306,207 @@ class OpenMeteoFetcherUk:
         # - cloud_cover (%)
         # ===============================================================
         for i, (lat, lon) in enumerate(self.SOLAR_SITES, start=1):
-            df_solar = self.fetch_openmeteo_hourly(
-                lat,
-                lon,
-                [
-                    "shortwave_radiation",  # ESSENTIAL: solar irradiance proxy
-                    "cloud_cover",  # ESSENTIAL: PV generation dampening
-                    "pressure_msl",
-                    "temperature_2m",
-                    "relative_humidity_2m",
-                    "precipitation",
-                ],
-            )
-            df_solar = df_solar.rename(
-                columns={
-                    "shortwave_radiation": f"solar_rad_site{i}",
-                    "cloud_cover": f"cloud_site_solar{i}",
-                    "pressure_msl": f"pressure_site_solar{i}",
-                    "temperature_2m": f"temp_site_solar{i}",
-                    "relative_humidity_2m": f"humidity_site_solar{i}",
-                    "precipitation": f"precip_site_solar{i}",
-                }
+            site_requests.append(
+                (
+                    lat,
+                    lon,
+                    [
+                        "shortwave_radiation",  # ESSENTIAL: solar irradiance proxy
+                        "cloud_cover",  # ESSENTIAL: PV generation dampening
+                        "pressure_msl",
+                        "temperature_2m",
+                        "relative_humidity_2m",
+                        "precipitation",
+                    ],
+                    {
+                        "shortwave_radiation": f"solar_rad_site{i}",
+                        "cloud_cover": f"cloud_site_solar{i}",
+                        "pressure_msl": f"pressure_site_solar{i}",
+                        "temperature_2m": f"temp_site_solar{i}",
+                        "relative_humidity_2m": f"humidity_site_solar{i}",
+                        "precipitation": f"precip_site_solar{i}",
+                    },
+                )
             )
-            all_dfs.append(df_solar)
 
-        df_all = pd.concat(all_dfs, axis=1)
+        return site_requests
+
+    def _combine_sites(
+        self, payloads: List[dict], interpolate_to_30min: bool
+    ) -> pd.DataFrame:
+        # Every site shares the same hourly index, so each response is copied
+        # straight into its slice of one preallocated block
+        idx = _time_index(payloads[0]["hourly"]["time"])
+        arr = np.empty((len(idx), len(self.column_names)), dtype=np.float32)
+
+        col = 0
+        for data, (lat, lon, hourly, _) in zip(payloads, self.site_requests):
+            if len(data["hourly"]["time"]) != len(idx):
+                raise ValueError(f"Site ({lat}, {lon}) returned a different time range")
+            for v in hourly:
+                arr[:, col] = np.asarray(data["hourly"][v], dtype=np.float32)
+                col += 1
+
+        df_all = pd.DataFrame(arr, index=idx, columns=self.column_names)
 
         if interpolate_to_30min:
             # Optional: convert to settlement half-hours
-            df_all = df_all.resample("30T").interpolate("time")
+            df_all = _interpolate_to_30min(df_all)
 
         self.weather_df = df_all
         return df_all
 
+    def load_cached(self, interpolate_to_30min: bool = True) -> pd.DataFrame | None:
+        """
+        Loads a previously saved dataset for this date range from cache_dir, if any.
+        A cached file at the other resolution (hourly vs 30 min) is ignored.
+        """
+        stem = f"uk_raw_weather_sites_start-{self.start_date}_end-{self.end_date}"
+        parquet_file = self.cache_dir / f"{stem}.parquet"
+        csv_file = self.cache_dir / f"{stem}.csv"
+
+        if parquet_file.exists():
+            df = pd.read_parquet(parquet_file)
+        elif csv_file.exists():
+            df = pd.read_csv(csv_file, parse_dates=["datetime"], index_col="datetime")
+            # Older CSVs named the wind pressure columns pressure_site{i} as well,
+            # which read back as duplicates with a ".1" suffix
+            df = df.rename(
+                columns={
+                    f"pressure_site{i}.1": f"pressure_site_wind{i}"
+                    for i in range(1, len(self.WIND_SITES) + 1)
+                }
+            )
+        else:
+            return None
+
+        step = pd.Timedelta("30min" if interpolate_to_30min else "1h")
+        if len(df.index) > 1 and df.index[1] - df.index[0] != step:
+            return None
+
+        self.weather_df = df
+        print(f"Loaded cached weather data for {self.start_date} → {self.end_date}")
+        if not parquet_file.exists():
+            # The mergers read Parquet, so migrate CSV-only years once
+            self.save_to_parquet()
+        return self.weather_df
+
+    def build_weather_dataset(
+        self, interpolate_to_30min: bool = True, force_refresh: bool = False
+    ) -> pd.DataFrame:
+        if (
+            not force_refresh
+            and (cached := self.load_cached(interpolate_to_30min)) is not None
+        ):
+            return cached
+
+        # Sites are independent, so fire them concurrently; results keep site order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+            futures = [
+                ex.submit(self._fetch_site_json, lat, lon, hourly)
+                for lat, lon, hourly, _ in self.site_requests
+            ]
+            payloads = [f.result() for f in futures]
+
+        return self._combine_sites(payloads, interpolate_to_30min)
+
+    async def build_weather_dataset_async(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        interpolate_to_30min: bool = True,
+        backoff_factor: float = 2,
+    ) -> pd.DataFrame:
+        payloads = await asyncio.gather(
+            *(
+                self._fetch_site_json_async(
+                    session, semaphore, lat, lon, hourly, backoff_factor=backoff_factor
+                )
+                for lat, lon, hourly, _ in self.site_requests
+            )
+        )
+
+        return self._combine_sites(payloads, interpolate_to_30min)
+
     # ----------------------------------------------------------------
-    # Save to CSV
+    # Save to CSV / Parquet
     # ----------------------------------------------------------------
-    def save_to_csv(self, dir_to_csv=Path("data/weather")) -> None:
+    def save_to_csv(self, dir_to_csv: Path | None = None) -> None:
         if self.weather_df is None:
             raise ValueError("No weather data has been fetched yet!")
 
+        dir_to_csv = dir_to_csv or self.cache_dir
         dir_to_csv.mkdir(parents=True, exist_ok=True)
         csv_filename = (
             f"uk_raw_weather_sites_start-{self.start_date}_end-{self.end_date}.csv"
         )
         csv_file = dir_to_csv / csv_filename
-        self.weather_df.to_csv(csv_file)
+        # Arrow's writer formats typed columns in C++ instead of cell by cell
+        table = pa.Table.from_pandas(
+            self.weather_df.reset_index(), preserve_index=False
+        )
+        pacsv.write_csv(table, str(csv_file))
         print(f"Weather data saved to {csv_file}")
 
+    def save_to_parquet(self, dir_to_parquet: Path | None = None) -> None:
+        if self.weather_df is None:
+            raise ValueError("No weather data has been fetched yet!")
+
+        dir_to_parquet = dir_to_parquet or self.cache_dir
+        dir_to_parquet.mkdir(parents=True, exist_ok=True)
+        parquet_filename = (
+            f"uk_raw_weather_sites_start-{self.start_date}_end-{self.end_date}.parquet"
+        )
+        parquet_file = dir_to_parquet / parquet_filename
+        self.weather_df.to_parquet(parquet_file, compression="zstd")
+        print(f"Weather data saved to {parquet_file}")
+
+
+async def _build_all_async(
+    fetchers: List[OpenMeteoFetcherUk],
+    backoff_factor: float,
+    max_concurrency: int = 8,
+) -> None:
+    # All years x sites share one connection pool and one request budget
+    semaphore = asyncio.Semaphore(max_concurrency)
+    connector = aiohttp.TCPConnector(limit=16)
+    timeout = aiohttp.ClientTimeout(total=120)
+
+    async def build_and_save(fetcher: OpenMeteoFetcherUk) -> None:
+        await fetcher.build_weather_dataset_async(
+            session, semaphore, backoff_factor=backoff_factor
+        )
+        # Save each year as soon as it is complete, so a later failure
+        # doesn't throw away the years that already finished
+        fetcher.save_to_parquet()
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        results = await asyncio.gather(
+            *(build_and_save(f) for f in fetchers), return_exceptions=True
+        )
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        raise errors[0]
+
+
+def fetch_2019_2024(backoff_factor: float = 2) -> None:
+    """
+    Fetches 2019-2024 in one event loop. Throttled or failed requests back off
+    for backoff_factor * 2**attempt seconds unless Open-Meteo sends Retry-After.
+    """
+    fetchers = [
+        OpenMeteoFetcherUk(start_date=f"{year}-01-01", end_date=f"{year}-12-31")
+        for year in range(2019, 2025)
+    ]
+
+    # Years already on disk are loaded instead of fetched
+    pending = [f for f in fetchers if f.load_cached() is None]
+    if not pending:
+        return
 
-def fetch_2019_2024(pause_time: int = 60) -> None:
-    fetcher_1 = OpenMeteoFetcherUk(start_date="2019-01-01", end_date="2019-12-31")
-    fetcher_2 = OpenMeteoFetcherUk(start_date="2020-01-01", end_date="2020-12-31")
-    fetcher_3 = OpenMeteoFetcherUk(start_date="2021-01-01", end_date="2021-12-31")
-    fetcher_4 = OpenMeteoFetcherUk(start_date="2022-01-01", end_date="2022-12-31")
-    fetcher_5 = OpenMeteoFetcherUk(start_date="2023-01-01", end_date="2023-12-31")
-    fetcher_6 = OpenMeteoFetcherUk(start_date="2024-01-01", end_date="2024-12-31")
-
-    # fetch & save
-    _ = fetcher_1.build_weather_dataset()
-    time.sleep(pause_time)
-    _ = fetcher_2.build_weather_dataset()
-    time.sleep(pause_time)
-    _ = fetcher_3.build_weather_dataset()
-    time.sleep(pause_time)
-    _ = fetcher_4.build_weather_dataset()
-    time.sleep(pause_time)
-    _ = fetcher_5.build_weather_dataset()
-    time.sleep(pause_time)
-    _ = fetcher_6.build_weather_dataset()
-
-    fetcher_1.save_to_csv()
-    fetcher_2.save_to_csv()
-    fetcher_3.save_to_csv()
-    fetcher_4.save_to_csv()
-    fetcher_5.save_to_csv()
-    fetcher_6.save_to_csv()
+    # fetch & save, one year at a time as they complete
+    run_sync(_build_all_async(pending, backoff_factor))
 
 
 def main() -> int:
@@ -245,10 +514,10 @@ def main() -> int:
         fetcher = OpenMeteoFetcherUk()
         # features = fetcher.build_weather_features()
         features = fetcher.build_weather_dataset()
-        fetcher.save_to_csv()
+        fetcher.save_to_parquet()
         print(features.head())
     else:
-        fetch_2019_2024(pause_time=61)
+        fetch_2019_2024()
 
     return 0
 
@@ -5,6 +5,8 @@ import numpy as np
 
 from typing import List
 
+from gridscope.data_preprocessing.io_utils import read_file
+
 
 class DataMerger30Min:
     def __init__(
@@ -20,12 +22,12 @@ class DataMerger30Min:
         self.uk_gas_prices_csv_path = uk_gas_prices_csv_path
 
     # ---------------------------------------------------------
-    # 1) Load and concatenate multiple CSV files safely
+    # 1) Load and concatenate multiple CSV / Parquet files safely
     # ---------------------------------------------------------
     def _load_concat(self, paths: List[str], parse_dates=None) -> pd.DataFrame:
         frames = []
         for p in paths:
-            df = pd.read_csv(p, parse_dates=parse_dates, low_memory=False)
+            df = read_file(p, parse_dates=parse_dates)
             frames.append(df)
         df = pd.concat(frames, ignore_index=True)
         return df
@@ -103,7 +105,7 @@ class DataMerger30Min:
     # 5) Load Gas Price (already 30-min resolution interpolated)
     # ---------------------------------------------------------
     def load_gas_prices(self) -> pd.DataFrame:
-        df = pd.read_csv(self.uk_gas_prices_csv_path, parse_dates=["date"])
+        df = read_file(self.uk_gas_prices_csv_path, parse_dates=["date"])
         df = df.rename(
             columns={"date": "timestamp", "SAP_GBP_per_MWh": "gas_price_GBP_MWh"}
         )
@@ -157,11 +159,11 @@ class DataMerger30Min:
 
 def main():
     uk_weather_csv_paths = [
-        "data/weather/uk_raw_weather_sites_start-2020-01-01_end-2020-12-31.csv",
-        "data/weather/uk_raw_weather_sites_start-2021-01-01_end-2021-12-31.csv",
-        "data/weather/uk_raw_weather_sites_start-2022-01-01_end-2022-12-31.csv",
-        "data/weather/uk_raw_weather_sites_start-2023-01-01_end-2023-12-31.csv",
-        "data/weather/uk_raw_weather_sites_start-2023-01-01_end-2023-12-31.csv",
+        "data/weather/uk_raw_weather_sites_start-2020-01-01_end-2020-12-31.parquet",
+        "data/weather/uk_raw_weather_sites_start-2021-01-01_end-2021-12-31.parquet",
+        "data/weather/uk_raw_weather_sites_start-2022-01-01_end-2022-12-31.parquet",
+        "data/weather/uk_raw_weather_sites_start-2023-01-01_end-2023-12-31.parquet",
+        "data/weather/uk_raw_weather_sites_start-2023-01-01_end-2023-12-31.parquet",
     ]
 
     neso_demand_csv_paths = [
@@ -172,13 +174,13 @@ def main():
         "data/neso/historical_demand/demanddata_2024.csv",
     ]
     uk_gas_imports_csv_paths = [
-        "data/gas/uk_gas_imports_2020-01-01_2020-12-31.csv",
-        "data/gas/uk_gas_imports_2021-01-01_2021-12-31.csv",
-        "data/gas/uk_gas_imports_2022-01-01_2022-12-31.csv",
-        "data/gas/uk_gas_imports_2023-01-01_2023-12-31.csv",
-        "data/gas/uk_gas_imports_2024-01-01_2024-12-31.csv",
+        "data/gas/uk_gas_imports_2020-01-01_2020-12-31.parquet",
+        "data/gas/uk_gas_imports_2021-01-01_2021-12-31.parquet",
+        "data/gas/uk_gas_imports_2022-01-01_2022-12-31.parquet",
+        "data/gas/uk_gas_imports_2023-01-01_2023-12-31.parquet",
+        "data/gas/uk_gas_imports_2024-01-01_2024-12-31.parquet",
     ]
-    uk_gas_prices_csv_path = "data/gas/processed/sap_gas_30min.csv"
+    uk_gas_prices_csv_path = "data/gas/processed/sap_gas_30min.parquet"
 
     merger = DataMerger30Min(
         uk_weather_csv_paths=uk_weather_csv_paths,
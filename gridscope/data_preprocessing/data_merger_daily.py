@@ -1,7 +1,14 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List
 
+from gridscope.data_preprocessing.io_utils import read_file
+
 
 class DataMergerDaily:
     def __init__(
@@ -10,21 +17,58 @@ class DataMergerDaily:
         neso_demand_csv_paths: List[str],
         uk_gas_imports_csv_paths: List[str],
         uk_gas_prices_csv_path: str,
+        low_memory: bool = True,
     ):
         self.uk_weather_csv_paths = uk_weather_csv_paths
         self.neso_demand_csv_paths = neso_demand_csv_paths
         self.uk_gas_imports_csv_paths = uk_gas_imports_csv_paths
         self.uk_gas_prices_csv_path = uk_gas_prices_csv_path
+        self.low_memory = low_memory  # float32 measurements, int16 periods
 
     # ---------------------------------------------------------
-    # 1) Load and concatenate multiple CSV files
+    # 1) Load and concatenate multiple CSV / Parquet files
     # ---------------------------------------------------------
-    def _load_concat(self, paths: List[str], parse_dates=None) -> pd.DataFrame:
-        frames = []
-        for p in paths:
-            df = pd.read_csv(p, parse_dates=parse_dates, low_memory=False)
-            frames.append(df)
-        return pd.concat(frames, ignore_index=True)
+    def _read_table(self, path: str, usecols=None) -> pa.Table:
+        if Path(path).suffix == ".parquet":
+            if usecols is not None:
+                names = pq.read_schema(path).names
+                usecols = [c for c in usecols if c in names]
+            return pq.read_table(path, columns=usecols, use_pandas_metadata=True)
+        convert_options = None
+        if usecols is not None:
+            # Older exports lack some columns, and Arrow rejects unknown include_columns
+            header = pd.read_csv(path, nrows=0).columns
+            convert_options = pv.ConvertOptions(
+                include_columns=[c for c in usecols if c in header]
+            )
+        return pv.read_csv(path, convert_options=convert_options)
+
+    def _downcast(self, table: pa.Table) -> pa.Table:
+        # Cast on the Arrow side so pandas never materialises the float64 copy
+        fields = []
+        for field in table.schema:
+            if pa.types.is_float64(field.type):
+                field = field.with_type(pa.float32())
+            elif field.name == "SETTLEMENT_PERIOD":
+                field = field.with_type(pa.int16())
+            fields.append(field)
+        return table.cast(pa.schema(fields, metadata=table.schema.metadata))
+
+    def _load_concat(
+        self, paths: List[str], parse_dates=None, usecols=None
+    ) -> pd.DataFrame:
+        # Concatenate as Arrow chunks and convert once, instead of copying
+        # every file through pd.concat; missing columns are null-filled
+        tables = [self._read_table(p, usecols=usecols) for p in paths]
+        table = pa.concat_tables(tables, promote_options="permissive")
+        if self.low_memory:
+            table = self._downcast(table)
+        df = table.to_pandas(self_destruct=True)
+        if df.index.name is not None:
+            df = df.reset_index()
+        for col in parse_dates or []:
+            df[col] = pd.to_datetime(df[col]).dt.as_unit("ns")
+        return df
 
     # ---------------------------------------------------------
     # 2) Weather → aggregate daily means
@@ -32,29 +76,18 @@ class DataMergerDaily:
     def load_weather_daily(self) -> pd.DataFrame:
         df = self._load_concat(self.uk_weather_csv_paths, parse_dates=["datetime"])
         df = df.rename(columns={"datetime": "timestamp"})
-        df["date"] = df["timestamp"].dt.date
+        # Truncate to day on the int64 values; .dt.date would build Python objects
+        df["date"] = df["timestamp"].values.astype("datetime64[D]")
         df = df.drop(columns=["timestamp"])
 
         # Daily average for all columns except the date
-        daily = df.groupby("date").mean(numeric_only=True)
-        daily.index = pd.to_datetime(daily.index)
-        return daily.reset_index().rename(columns={"date": "timestamp"})
+        daily = df.groupby("date", sort=False).mean(numeric_only=True)
+        return daily.rename_axis("timestamp").sort_index()
 
     # ---------------------------------------------------------
     # 3) NESO → convert SP to timestamp, then aggregate daily
     # ---------------------------------------------------------
     def load_neso_daily(self) -> pd.DataFrame:
-        df = self._load_concat(self.neso_demand_csv_paths)
-
-        df["SETTLEMENT_DATE"] = pd.to_datetime(
-            df["SETTLEMENT_DATE"], errors="coerce", format="%d-%b-%Y"
-        )
-        df["timestamp"] = df["SETTLEMENT_DATE"] + pd.to_timedelta(
-            (df["SETTLEMENT_PERIOD"] - 1) * 30, unit="m"
-        )
-        df["date"] = df["timestamp"].dt.date
-
-        # Fill missing columns as before
         required = [
             "ND",
             "TSD",
@@ -77,9 +110,33 @@ class DataMergerDaily:
             "VIKING_FLOW",
             "GREENLINK_FLOW",
         ]
-        for col in required:
-            if col not in df.columns:
-                df[col] = 0.0
+
+        # Only materialise the columns used below
+        df = self._load_concat(
+            self.neso_demand_csv_paths,
+            usecols=required + ["SETTLEMENT_DATE", "SETTLEMENT_PERIOD"],
+        )
+
+        # Every date repeats once per settlement period, so parse each one only once
+        uniq = df["SETTLEMENT_DATE"].unique()
+        parsed = pd.to_datetime(uniq, errors="coerce", format="%d-%b-%Y")
+        df["SETTLEMENT_DATE"] = df["SETTLEMENT_DATE"].map(dict(zip(uniq, parsed)))
+        # Plain numpy datetime arithmetic: no TimedeltaIndex, NaT dates and
+        # missing periods propagate as NaT
+        dates = df["SETTLEMENT_DATE"].to_numpy("datetime64[ns]")
+        sp = df["SETTLEMENT_PERIOD"].to_numpy(np.float64, na_value=np.nan)
+        df["timestamp"] = dates + ((sp - 1) * 30).astype("timedelta64[m]")
+
+        # Fill missing columns as before, in one block rather than one insert each
+        missing = [c for c in required if c not in df.columns]
+        if missing:
+            fill = pd.DataFrame(
+                0.0,
+                index=df.index,
+                columns=missing,
+                dtype=np.float32 if self.low_memory else np.float64,
+            )
+            df = pd.concat([df, fill], axis=1, copy=False)
 
         # Daily aggregation rules
         agg_rules = {
@@ -109,9 +166,13 @@ class DataMergerDaily:
             "GREENLINK_FLOW": "sum",
         }
 
-        daily = df.groupby("date").agg(agg_rules)
-        daily.index = pd.to_datetime(daily.index)
-        return daily.reset_index().rename(columns={"date": "timestamp"})
+        # Resample bins the sorted timestamps directly; NaT rows are left out
+        df = df.set_index("timestamp").sort_index()
+        resampled = df.resample("D")
+        daily = resampled.agg(agg_rules)
+        # Resample emits empty days too; drop them so merge() forward-fills
+        # them instead of seeing zero sums
+        return daily[resampled.size() > 0]
 
     # ---------------------------------------------------------
     # 4) Gas imports are already daily
@@ -119,20 +180,19 @@ class DataMergerDaily:
     def load_gas_imports_daily(self) -> pd.DataFrame:
         df = self._load_concat(self.uk_gas_imports_csv_paths, parse_dates=["timestamp"])
         df = df.rename(columns={"UK_imports_MWh_hour": "gas_imports_MWh_daily"})
-        df["timestamp"] = df["timestamp"].dt.date
-        df = df.groupby("timestamp").first().reset_index()
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        return df
+        df["timestamp"] = pd.to_datetime(df["timestamp"].dt.date)
+        return df.groupby("timestamp").first().sort_index()
 
     # ---------------------------------------------------------
     # 5) Gas prices are daily
     # ---------------------------------------------------------
     def load_gas_prices_daily(self) -> pd.DataFrame:
-        df = pd.read_csv(self.uk_gas_prices_csv_path, parse_dates=["date"])
+        df = read_file(self.uk_gas_prices_csv_path, parse_dates=["date"])
         df = df.rename(columns={"date": "timestamp"})
         df["timestamp"] = df["timestamp"].dt.date
         df["timestamp"] = pd.to_datetime(df["timestamp"])
-        return df[["timestamp", "SAP_p_per_kWh", "SAP_GBP_per_MWh"]]
+        df = df.set_index("timestamp").sort_index()
+        return df[["SAP_p_per_kWh", "SAP_GBP_per_MWh"]]
 
     # ---------------------------------------------------------
     # 6) Merge all into a daily dataset
@@ -140,33 +200,28 @@ class DataMergerDaily:
     def merge(self) -> pd.DataFrame:
         print("Loading daily datasets...")
 
-        weather = self.load_weather_daily()
-        neso = self.load_neso_daily()
-        gas_imports = self.load_gas_imports_daily()
-        gas_prices = self.load_gas_prices_daily()
+        # The loaders are independent and mostly I/O, so overlap the reads
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            fw = ex.submit(self.load_weather_daily)
+            fn = ex.submit(self.load_neso_daily)
+            fg = ex.submit(self.load_gas_imports_daily)
+            fp = ex.submit(self.load_gas_prices_daily)
+            weather, neso = fw.result(), fn.result()
+            gas_imports, gas_prices = fg.result(), fp.result()
 
         # Build full daily index
         start = pd.to_datetime("2020-01-01")
         end = pd.to_datetime("2024-12-31")
-        idx = pd.date_range(start, end, freq="D")
-
-        base = pd.DataFrame({"timestamp": idx})
-
-        print("Merging weather daily...")
-        base = base.merge(weather, on="timestamp", how="left")
-
-        print("Merging NESO daily...")
-        base = base.merge(neso, on="timestamp", how="left")
-
-        print("Merging gas imports daily...")
-        base = base.merge(gas_imports, on="timestamp", how="left")
+        idx = pd.date_range(start, end, freq="D", name="timestamp")
 
-        print("Merging gas prices daily...")
-        base = base.merge(gas_prices, on="timestamp", how="left")
+        # Every loader returns a sorted daily index, so align them all in one pass
+        print("Merging daily datasets...")
+        base = pd.concat([weather, neso, gas_imports, gas_prices], axis=1, copy=False)
+        assert base.index.is_unique, "Duplicate days in daily inputs"
+        base = base.reindex(idx)
 
-        # Forward-fill numeric columns
-        numeric_cols = base.select_dtypes(include=[np.number]).columns
-        base[numeric_cols] = base[numeric_cols].fillna(method="ffill")
+        # Forward-fill; with timestamp as the index every column is numeric
+        base = base.ffill().reset_index()
 
         print("Final shape:", base.shape)
         return base
@@ -182,11 +237,11 @@ class DataMergerDaily:
 
 def main():
     uk_weather_csv_paths = [
-        "data/weather/uk_raw_weather_sites_start-2020-01-01_end-2020-12-31.csv",
-        "data/weather/uk_raw_weather_sites_start-2021-01-01_end-2021-12-31.csv",
-        "data/weather/uk_raw_weather_sites_start-2022-01-01_end-2022-12-31.csv",
-        "data/weather/uk_raw_weather_sites_start-2023-01-01_end-2023-12-31.csv",
-        "data/weather/uk_raw_weather_sites_start-2023-01-01_end-2023-12-31.csv",
+        "data/weather/uk_raw_weather_sites_start-2020-01-01_end-2020-12-31.parquet",
+        "data/weather/uk_raw_weather_sites_start-2021-01-01_end-2021-12-31.parquet",
+        "data/weather/uk_raw_weather_sites_start-2022-01-01_end-2022-12-31.parquet",
+        "data/weather/uk_raw_weather_sites_start-2023-01-01_end-2023-12-31.parquet",
+        "data/weather/uk_raw_weather_sites_start-2023-01-01_end-2023-12-31.parquet",
     ]
 
     neso_demand_csv_paths = [
@@ -197,13 +252,13 @@ def main():
         "data/neso/historical_demand/demanddata_2024.csv",
     ]
     uk_gas_imports_csv_paths = [
-        "data/gas/uk_gas_imports_2020-01-01_2020-12-31.csv",
-        "data/gas/uk_gas_imports_2021-01-01_2021-12-31.csv",
-        "data/gas/uk_gas_imports_2022-01-01_2022-12-31.csv",
-        "data/gas/uk_gas_imports_2023-01-01_2023-12-31.csv",
-        "data/gas/uk_gas_imports_2024-01-01_2024-12-31.csv",
+        "data/gas/uk_gas_imports_2020-01-01_2020-12-31.parquet",
+        "data/gas/uk_gas_imports_2021-01-01_2021-12-31.parquet",
+        "data/gas/uk_gas_imports_2022-01-01_2022-12-31.parquet",
+        "data/gas/uk_gas_imports_2023-01-01_2023-12-31.parquet",
+        "data/gas/uk_gas_imports_2024-01-01_2024-12-31.parquet",
     ]
-    uk_gas_prices_csv_path = "data/gas/processed/sap_gas_daily.csv"
+    uk_gas_prices_csv_path = "data/gas/processed/sap_gas_daily.parquet"
 
     merger = DataMergerDaily(
         uk_weather_csv_paths,
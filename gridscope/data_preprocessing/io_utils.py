@@ -0,0 +1,14 @@
+import pandas as pd
+from pathlib import Path
+
+
+def read_file(path: str, parse_dates=None) -> pd.DataFrame:
+    """
+    Read a CSV or Parquet export into a DataFrame, picking the reader from the
+    file suffix.
+    """
+    if Path(path).suffix == ".parquet":
+        # Parquet keeps dtypes and the saved index; expose it as a column like read_csv
+        df = pd.read_parquet(path)
+        return df.reset_index() if df.index.name is not None else df
+    return pd.read_csv(path, engine="pyarrow", parse_dates=parse_dates)
@@ -0,0 +1,19 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# SQLite file (without suffix) shared by the requests_cache sessions
+HTTP_CACHE_PATH = Path("data/http_cache")
+
+
+def run_sync(coro):
+    """
+    asyncio.run that also works when an event loop is already running (e.g. in
+    Jupyter), by running the coroutine on a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        return ex.submit(asyncio.run, coro).result()